@@ -0,0 +1,204 @@
+"""
+Behavior tests for reddit_code.py, run against a fake Reddit client.
+
+Run with:
+    python -m pytest
+"""
+
+import csv
+import gzip
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import prawcore
+import pytest
+
+import reddit_code
+
+
+def make_post(permalink, **fields):
+    """Build raw post data the way a Reddit listing returns it."""
+    post = {
+        'title': f"Post {permalink}",
+        'score': 5,
+        'upvote_ratio': 0.9,
+        'num_comments': 3,
+        'author': "someone",
+        'url': f"https://www.reddit.com{permalink}",
+        'permalink': permalink,
+        'created_utc': 1762049735.0,
+        'is_self': True,
+        'selftext': "body",
+        'link_flair_text': "Discussion",
+        'domain': "self.test"
+    }
+    post.update(fields)
+    return post
+
+
+class FakeReddit:
+    """Stand-in for praw.Reddit that serves listing pages from memory."""
+
+    def __init__(self, listings):
+        self.listings = listings
+        self.requests = []
+        # Plenty of quota left, so the request pacer never sleeps
+        self.auth = SimpleNamespace(limits={'remaining': 1000.0, 'reset_timestamp': time.time()})
+
+    def request(self, method, path, params):
+        self.requests.append((method, path, dict(params)))
+        posts = self.listings[path]
+        start = int(params.get('after') or 0)
+        page = posts[start:start + params['limit']]
+        after = str(start + len(page)) if start + len(page) < len(posts) else None
+        return {'data': {'children': [{'data': post} for post in page], 'after': after}}
+
+
+def test_zero_and_false_values_are_kept():
+    reddit = FakeReddit({'r/test/hot': [
+        make_post("/r/test/1", score=0, num_comments=0, is_self=False, selftext="")
+    ]})
+
+    posts = reddit_code.download_hot_posts(reddit, ["test"])
+
+    assert posts['score'] == [0]
+    assert posts['num_comments'] == [0]
+    assert posts['is_self'] == [False]
+    assert posts['selftext'] == [None]
+    assert posts['flair'] == ["Discussion"]
+    assert posts['subreddit'] == ["test"]
+    assert posts['search_query'] == [None]
+
+
+def test_threaded_fetch_keeps_subreddit_order():
+    names = ["a", "b", "c", "d"]
+    listings = {f"r/{name}/hot": [make_post(f"/r/{name}/{i}") for i in range(3)] for name in names}
+    reddit = FakeReddit(listings)
+    clients = [reddit, FakeReddit(listings), FakeReddit(listings)]
+
+    posts = reddit_code.download_hot_posts(reddit, names, limit=3, clients=clients)
+
+    assert posts['subreddit'] == [name for name in names for _ in range(3)]
+    assert sum(len(client.requests) for client in clients) == len(names)
+
+
+def test_fetch_without_clients_stays_on_one_instance():
+    names = ["a", "b", "c"]
+    reddit = FakeReddit({f"r/{name}/hot": [make_post(f"/r/{name}/1")] for name in names})
+
+    posts = reddit_code.download_hot_posts(reddit, names)
+
+    assert posts['subreddit'] == names
+    assert [path for _, path, _ in reddit.requests] == ["r/a/hot", "r/b/hot", "r/c/hot"]
+
+
+def test_search_posts_pages_through_listing():
+    reddit = FakeReddit({'r/test/search': [make_post(f"/r/test/{i}") for i in range(150)]})
+
+    posts = reddit_code.search_posts(reddit, "GPT-4", ["test"], limit=120)
+
+    assert len(posts['permalink']) == 120
+    assert posts['search_query'] == ["GPT-4"] * 120
+    assert [params['limit'] for _, _, params in reddit.requests] == [100, 20]
+    assert reddit.requests[0][2]['q'] == "GPT-4"
+
+
+def test_deleted_author_is_missing():
+    reddit = FakeReddit({'r/test/hot': [make_post("/r/test/1", author="[deleted]")]})
+
+    posts = reddit_code.download_hot_posts(reddit, ["test"])
+
+    assert posts['author'] == [None]
+
+
+def test_rate_limited_page_is_retried():
+    reddit = FakeReddit({'r/test/hot': [make_post("/r/test/1")]})
+    request = reddit.request
+    response = SimpleNamespace(status_code=429, text="", headers={'retry-after': "0"})
+    calls = []
+
+    def flaky_request(method, path, params):
+        calls.append(path)
+        if len(calls) == 1:
+            raise prawcore.exceptions.TooManyRequests(response)
+        return request(method, path, params)
+
+    reddit.request = flaky_request
+
+    posts = reddit_code.download_hot_posts(reddit, ["test"])
+
+    assert posts['permalink'] == ["/r/test/1"]
+    assert len(calls) == 2
+
+
+@pytest.fixture
+def collected():
+    """Two batches sharing one permalink, with zero and False values."""
+    reddit = FakeReddit({
+        'r/test/hot': [make_post("/r/test/1", score=0, is_self=False), make_post("/r/test/2")],
+        'r/test/search': [make_post("/r/test/2"), make_post("/r/test/3")]
+    })
+    hot_posts = reddit_code.download_hot_posts(reddit, ["test"])
+    search_results = reddit_code.search_posts(reddit, "query", ["test"])
+    return reddit_code._concat_columns([hot_posts, search_results])
+
+
+@pytest.mark.parametrize("filename, opener", [
+    ("out.csv", lambda path: open(path, newline="", encoding="utf-8")),
+    ("out.csv.gz", lambda path: gzip.open(path, "rt", newline="", encoding="utf-8"))
+])
+def test_save_csv_dedups_and_keeps_values(tmp_path, collected, filename, opener):
+    path = str(tmp_path / filename)
+
+    assert reddit_code.save_posts(collected, path) == 3
+
+    with opener(path) as f:
+        text = f.read()
+    with opener(path) as f:
+        rows = list(csv.DictReader(f))
+    assert "\r\n" not in text
+    assert [row['permalink'] for row in rows] == ["/r/test/1", "/r/test/2", "/r/test/3"]
+    assert rows[0]['score'] == "0"
+    assert rows[0]['is_self'] == "False"
+    assert rows[1]['search_query'] == ""
+
+
+def test_save_parquet_dedups_and_keeps_values(tmp_path, collected):
+    path = str(tmp_path / "out.parquet")
+
+    assert reddit_code.save_posts(collected, path) == 3
+
+    df = pd.read_parquet(path)
+    assert list(df['permalink']) == ["/r/test/1", "/r/test/2", "/r/test/3"]
+    assert df['score'].iloc[0] == 0
+    assert not df['is_self'].iloc[0]
+
+
+@pytest.mark.parametrize("filename", ["out.txt", "reddit_data.cvs", "out"])
+def test_save_posts_rejects_unknown_extension(tmp_path, collected, filename):
+    path = tmp_path / filename
+
+    with pytest.raises(ValueError):
+        reddit_code.save_posts(collected, str(path))
+    assert not path.exists()
+
+
+def test_save_sqlite_dedups_across_runs(tmp_path, collected):
+    path = str(tmp_path / "out.db")
+
+    assert reddit_code.save_posts(collected, path) == 3
+    # A re-run with the same posts adds nothing, but the dataset still holds all of them
+    assert reddit_code.save_posts(collected, path) == 3
+
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT permalink, score, is_self FROM posts ORDER BY permalink").fetchall()
+    assert rows == [("/r/test/1", 0, 0), ("/r/test/2", 5, 1), ("/r/test/3", 5, 1)]
+
+
+def test_save_sqlite_skips_posts_without_permalink(tmp_path, collected):
+    path = str(tmp_path / "out.db")
+    collected['permalink'][0] = None
+
+    assert reddit_code.save_posts(collected, path) == 2